@@ -3,6 +3,6 @@ from playwright.sync_api import sync_playwright
 with sync_playwright() as p:
     browser = p.chromium.launch(headless=True)  # headless enabled
     page = browser.new_page()
-    page.goto("https://example.com")
+    page.goto("https://example.com", wait_until="domcontentloaded")
     print(page.title())
     browser.close()